@@ -0,0 +1,149 @@
+#!/usr/bin/python3
+
+# -*- coding: utf-8 -*-
+#
+# This script along with its template called ip_route.template from parser_templates are owned by Valentin Soare.
+# Licensed under the GNU General Public License, version 3 (GPL-3.0).
+# See the LICENSE file in the root directory for details.
+#
+# Author: Valentin Soare
+
+"""
+Generates a specialized parser module from the ip route TextFSM template.
+
+The template grammar is fixed at build time, so instead of compiling it
+into a regex state machine on every run, this script reads the keyword to
+field pairs out of the template rules and writes generated_ip_route_parser.py,
+a plain-Python module that walks tokens with no regex or TextFSM at all.
+Rerun this script whenever parser_templates/ip_route.template changes.
+"""
+
+import re
+
+TEMPLATE_PATH: str = "parser_templates/ip_route.template"
+GENERATED_PATH: str = "generated_ip_route_parser.py"
+
+_LEADING_VALUE = re.compile(r'\^\$\{(\w+)\}')
+_KEYWORD_PAIR = re.compile(r'(\w+)\\s\+\$\{(\w+)\}')
+
+
+def _extract_grammar(template_text: str) -> tuple:
+    """
+    Pulls the positional field and the keyword/field pairs out of the template rules.
+
+    Args:
+        template_text (str): The content of the TextFSM template file.
+
+    Returns:
+        tuple: The field name bound at the start of each rule and a dict
+               mapping each rule keyword to the field it fills.
+    """
+    leading_field: str = ''
+    keywords: dict = {}
+
+    for line in template_text.splitlines():
+        rule = line.strip()
+
+        if not rule.startswith('^'):
+            continue
+
+        leading_match = _LEADING_VALUE.match(rule)
+
+        if leading_match:
+            leading_field = leading_match.group(1)
+
+        for keyword, field in _KEYWORD_PAIR.findall(rule):
+            keywords[keyword] = field
+
+    return leading_field, keywords
+
+
+def _render_module(leading_field: str, keywords: dict) -> str:
+    """
+    Renders the source of the generated parser module.
+
+    Args:
+        leading_field (str): The field name filled by the first token of each line.
+        keywords (dict): The mapping from rule keyword to field name.
+
+    Returns:
+        str: The full source text of the generated module.
+    """
+    gateway_field: str = keywords.get('via', 'gateway')
+    keyword_lines = "\n".join(f"    {keyword!r}: {field!r}," for keyword, field in keywords.items())
+
+    return f'''\
+#!/usr/bin/python3
+
+# -*- coding: utf-8 -*-
+#
+# Generated by build_parser.py from {TEMPLATE_PATH} - do not edit by hand.
+# Rerun build_parser.py after changing the template.
+
+"""
+Specialized parser for linux ip route output.
+
+The keyword grammar below was extracted from the TextFSM template at build
+time, so parsing is a plain token walk with no regex work at runtime.
+"""
+
+_KEYWORDS: dict = {{
+{keyword_lines}
+}}
+
+
+def parse(input_from_user: str) -> tuple:
+    """
+    Parses ip route output into a list of dictionaries.
+
+    Args:
+        input_from_user (str): The routing table input as a string.
+
+    Returns:
+        tuple: A list of dictionaries, each representing a routing entry,
+               and a flag telling whether any entry carries a gateway.
+    """
+    output: list = []
+    has_gateway: bool = False
+
+    for line in input_from_user.splitlines():
+        tokens = line.split()
+
+        if not tokens:
+            continue
+
+        result: dict = {{{leading_field!r}: tokens[0]}}
+        i = 1
+
+        while i < len(tokens) - 1:
+            field = _KEYWORDS.get(tokens[i])
+
+            if field is not None:
+                result[field] = tokens[i + 1]
+
+                if field == {gateway_field!r}:
+                    has_gateway = True
+
+                i += 2
+            else:
+                i += 1
+
+        output.append(result)
+
+    return output, has_gateway
+'''
+
+
+def generate() -> None:
+    """
+    Reads the template, renders the parser module and writes it to disk.
+    """
+    with open(TEMPLATE_PATH) as template_file:
+        leading_field, keywords = _extract_grammar(template_file.read())
+
+    with open(GENERATED_PATH, 'w') as generated_file:
+        generated_file.write(_render_module(leading_field, keywords))
+
+
+if __name__ == '__main__':
+    generate()
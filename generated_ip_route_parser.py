@@ -0,0 +1,63 @@
+#!/usr/bin/python3
+
+# -*- coding: utf-8 -*-
+#
+# Generated by build_parser.py from parser_templates/ip_route.template - do not edit by hand.
+# Rerun build_parser.py after changing the template.
+
+"""
+Specialized parser for linux ip route output.
+
+The keyword grammar below was extracted from the TextFSM template at build
+time, so parsing is a plain token walk with no regex work at runtime.
+"""
+
+_KEYWORDS: dict = {
+    'via': 'gateway',
+    'dev': 'device',
+    'proto': 'proto',
+    'scope': 'scope',
+    'src': 'src',
+    'metric': 'metric',
+}
+
+
+def parse(input_from_user: str) -> tuple:
+    """
+    Parses ip route output into a list of dictionaries.
+
+    Args:
+        input_from_user (str): The routing table input as a string.
+
+    Returns:
+        tuple: A list of dictionaries, each representing a routing entry,
+               and a flag telling whether any entry carries a gateway.
+    """
+    output: list = []
+    has_gateway: bool = False
+
+    for line in input_from_user.splitlines():
+        tokens = line.split()
+
+        if not tokens:
+            continue
+
+        result: dict = {'dst': tokens[0]}
+        i = 1
+
+        while i < len(tokens) - 1:
+            field = _KEYWORDS.get(tokens[i])
+
+            if field is not None:
+                result[field] = tokens[i + 1]
+
+                if field == 'gateway':
+                    has_gateway = True
+
+                i += 2
+            else:
+                i += 1
+
+        output.append(result)
+
+    return output, has_gateway
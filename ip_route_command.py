@@ -10,11 +10,26 @@
 #
 # Author: Valentin Soare
 
-import argparse
+import concurrent.futures
+import functools
+import io
 import json
 import os
+import subprocess
+import sys
+import threading
 
-import textfsm
+try:
+    from generated_ip_route_parser import parse as _parse_routes_generated
+except ImportError:
+    _parse_routes_generated = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_BULK_ROW_THRESHOLD: int = 1024
 
 
 def _take_input_from_commandline() -> str:
@@ -23,6 +38,8 @@ def _take_input_from_commandline() -> str:
     Returns:
         str: The routing table input provided by the user.
     """
+    import argparse
+
     parser = argparse.ArgumentParser(description='Parse linux routing table output.')
     parser.add_argument('ip_route_output', type=str, help='Routing table input (ip route output) as a string.')
     args = parser.parse_args()
@@ -48,7 +65,142 @@ default via 192.168.1.1 dev eth0
 
 
 def _take_input_directly_from_iproute_command() -> str:
-    return os.popen('ip route').read()
+    """
+    Runs the ip route command directly, without going through a shell,
+    and returns its output as a string.
+
+    Returns:
+        str: The output of the ip route command.
+    """
+    return subprocess.run(['ip', '-o', 'route'], capture_output=True, check=True).stdout.decode('ascii')
+
+
+def _run_commands(commands: list) -> list:
+    """
+    Runs a batch of commands and collects their outputs.
+
+    All children are spawned before any output is read, so the commands
+    execute concurrently and the reads drain pipes that are already full,
+    instead of paying a full spawn-plus-blocking-read cycle per command.
+
+    Args:
+        commands (list): The commands to run, each as an argument list.
+
+    Returns:
+        list: The decoded stdout of each command, in input order.
+    """
+    children = [subprocess.Popen(command, stdout=subprocess.PIPE) for command in commands]
+
+    return [child.communicate()[0].decode('ascii') for child in children]
+
+
+@functools.lru_cache(maxsize=8)
+def _load_template_text(name_of_file_template: str, mtime: float) -> str:
+    """
+    Reads the TextFSM template file once and caches its content.
+
+    The modification time is part of the cache key so an edited template
+    is picked up on the next call without restarting the process.
+
+    Args:
+        name_of_file_template (str): The path to the TextFSM template file.
+        mtime (float): The modification time of the template file.
+
+    Returns:
+        str: The content of the template file.
+    """
+    with open(name_of_file_template, buffering=131072) as template_file:
+        return template_file.read()
+
+
+_fsm_per_thread = threading.local()
+
+
+def _get_fsm(name_of_file_template: str) -> object:
+    """
+    Returns this thread's TextFSM object for the given template, built from
+    the cached template text.
+
+    TextFSM objects hold mutable parser state, so one compiled instance
+    cannot be shared across threads. Each thread keeps its own in a
+    threading.local and resets it between parses, which avoids both lock
+    contention and recompiling the template on every call.
+
+    Args:
+        name_of_file_template (str): The path to the TextFSM template file.
+
+    Returns:
+        object: A reset TextFSM object ready to parse input.
+    """
+    import textfsm
+
+    template_text = _load_template_text(name_of_file_template, os.path.getmtime(name_of_file_template))
+    fsm = getattr(_fsm_per_thread, 'fsm', None)
+
+    if fsm is None or getattr(_fsm_per_thread, 'template_text', None) is not template_text:
+        fsm = textfsm.TextFSM(io.StringIO(template_text))
+        _fsm_per_thread.fsm = fsm
+        _fsm_per_thread.template_text = template_text
+    else:
+        fsm.Reset()
+
+    return fsm
+
+
+_ROUTE_KEYWORDS: dict = {
+    'via': 'gateway',
+    'dev': 'device',
+    'proto': 'proto',
+    'scope': 'scope',
+    'src': 'src',
+    'metric': 'metric'
+}
+
+
+def _parse_routes(input_from_user: str) -> tuple:
+    """
+    Parses ip route output with a plain keyword walk, without TextFSM.
+
+    The grammar of an ip route line is fixed - a destination followed by
+    keyword/value pairs (via, dev, proto, scope, src, metric) - so a simple
+    str.split walk over each line extracts the same fields as the TextFSM
+    template with no regex or state machine compilation involved.
+
+    Args:
+        input_from_user (str): The routing table input as a string.
+
+    Returns:
+        tuple: A list of dictionaries, each representing a routing entry,
+               and a flag telling whether any entry carries a gateway.
+    """
+    output: list = []
+    has_gateway: bool = False
+
+    for line in input_from_user.splitlines():
+        tokens = line.split()
+
+        if not tokens:
+            continue
+
+        result: dict = {'dst': tokens[0]}
+        i = 1
+
+        while i < len(tokens) - 1:
+            field = _ROUTE_KEYWORDS.get(tokens[i])
+
+            if field is not None:
+                result[field] = tokens[i + 1]
+
+                if field == 'gateway':
+                    has_gateway = True
+
+                i += 2
+            else:
+                i += 1
+
+        output.append(result)
+
+    return output, has_gateway
 
 
 def _parse_input(name_of_file_template: str, input_from_user: str) -> tuple:
@@ -62,14 +214,13 @@ def _parse_input(name_of_file_template: str, input_from_user: str) -> tuple:
     Returns:
         tuple: A tuple containing the parsed results and the TextFSM object.
     """
-    with open(name_of_file_template) as template_file:
-        fsm = textfsm.TextFSM(template_file)
-        parsed_results = fsm.ParseText(input_from_user)
+    fsm = _get_fsm(name_of_file_template)
+    parsed_results = fsm.ParseText(input_from_user)
 
     return parsed_results, fsm
 
 
-def _extract_output(content_parsed: list, fsm_like: object) -> list:
+def _extract_output(content_parsed: list, fsm_like: object) -> tuple:
     """
     Extracts and formats the parsed routing information into a list of dictionaries.
 
@@ -78,94 +229,158 @@ def _extract_output(content_parsed: list, fsm_like: object) -> list:
         fsm_like (object): The TextFSM object used for parsing.
 
     Returns:
-        list: A list of dictionaries, each representing a routing entry.
+        tuple: A list of dictionaries, each representing a routing entry,
+               and a flag telling whether any entry carries a gateway.
     """
+    elements = tuple(fsm_like.header)
+
+    if numpy is not None and len(content_parsed) >= _BULK_ROW_THRESHOLD:
+        return _extract_output_bulk(content_parsed, elements)
+
     output: list = []
-    elements = fsm_like.header
+    has_gateway: bool = False
+    append = output.append
 
     for row in content_parsed:
-        result: dict = {}
+        entry = {k: v for k, v in zip(elements, row) if v}
+        has_gateway = has_gateway or 'gateway' in entry
+        append(entry)
 
-        for i in range(len(elements)):
-            if row[i] != '':
-                result[elements[i]] = row[i]
+    return output, has_gateway
 
-        output.append(result)
 
-    return output
+def _extract_output_bulk(content_parsed: list, elements: tuple) -> tuple:
+    """
+    Bulk variant of _extract_output for large batches of parsed rows.
 
+    The rows are loaded into one object array so the non-empty mask and the
+    gateway check run vectorized across the whole batch, which pays off when
+    routes are aggregated from many hosts at once.
+
+    Args:
+        content_parsed (list): The parsed routing information as a list of lists.
+        elements (tuple): The header names matching the row columns.
 
-def _validate_output(output_elements: list) -> list:
+    Returns:
+        tuple: A list of dictionaries, each representing a routing entry,
+               and a flag telling whether any entry carries a gateway.
     """
-    Validates and formats the output elements for JSON-like representation.
+    rows = numpy.asarray(content_parsed, dtype=object)
+    names = numpy.asarray(elements, dtype=object)
+    mask = rows != ''
+
+    if 'gateway' in elements:
+        has_gateway = bool(mask[:, elements.index('gateway')].any())
+    else:
+        has_gateway = False
+
+    output: list = [dict(zip(names[row_mask], row[row_mask])) for row, row_mask in zip(rows, mask)]
 
-    This function checks if the output elements list is empty or if the first element lacks a 'gateway' key,
-    which are conditions indicating the input might not be from a valid Linux ip route command. If the validation
-    fails, it prints an error message and exits the program. Otherwise, it encloses the output elements in brackets
-    to mimic a JSON array format, enhancing readability and consistency for further processing or display.
+    return output, has_gateway
+
+
+def _validate_output(output_elements: list, has_gateway: bool) -> list:
+    """
+    Validates the output elements before they are formatted for display.
+
+    This function checks if the output elements list is empty or if no entry carries a 'gateway' key,
+    which are conditions indicating the input might not be from a valid Linux ip route command. The
+    gateway flag is computed while the entries are built, so validation does not walk the list of
+    dictionaries a second time. Library callers get a ValueError on bad input; only the command line
+    entry point turns that into a printed error and a process exit.
 
     Args:
         output_elements (list): The list of dictionaries representing parsed routing information.
+        has_gateway (bool): Whether any entry carries a gateway, as reported by the parser.
 
     Returns:
-        list: The validated and formatted list of dictionaries, enclosed in brackets if valid.
-              Exits the program if the validation fails.
+        list: The validated list of dictionaries.
 
     Raises:
-        SystemExit: If the input is not from a Linux ip route command or the list is empty.
+        ValueError: If the input is not from a Linux ip route command or the list is empty.
     """
 
-    error_message: str = "ERROR - Input given is not from linux ip route command"
-
-    if not output_elements or not any("gateway" in elem for elem in output_elements):
-        print(error_message)
-        exit(0)
+    if not output_elements or not has_gateway:
+        raise ValueError("Input given is not from linux ip route command")
 
     return output_elements
 
 
-def generate_output(output: list, classic_style=True) -> str:
+def generate_output(output: list) -> str:
     """
-    Generates a string representation of the output list.
+    Generates the JSON string representation of the output list.
 
-    This function either formats the output list as a JSON string or, if classic printing is enabled,
-    manually constructs a string representation that mimics a JSON array format by enclosing the list
-    in brackets and separating elements with commas. The classic printing mode is intended for scenarios
-    where JSON formatting is not preferred or applicable.
+    The whole list is serialized with a single json.dumps call, which runs
+    the C serializer in one pass over the data.
 
     Args:
         output (list): The list of dictionaries representing parsed routing information.
-        classic_style (bool, optional): Flag indicating whether to use classic printing instead of JSON. Defaults to True.
 
     Returns:
-        str: The formatted string representation of the output.
+        str: The output as a compact JSON array.
     """
-    if classic_style:
-        final_output: list = []
+    return json.dumps(output, separators=(",", ":"))
 
-        for i, e in enumerate(output):
-            if 0 < i < len(output):
-                final_output.append("\n")
 
-            final_output.append(e)
+@functools.lru_cache(maxsize=16)
+def _parse_one(raw_input: str) -> str:
+    """
+    Parses one raw ip route output into its final string form.
 
-        return "".join(str(j) for j in final_output)
+    This is a pure function of its input - it returns the formatted string
+    or raises, with no I/O or process exit - so results are memoized and
+    callers that poll a routing table which rarely changes get the previous
+    answer back without reparsing anything.
 
-    return json.dumps(output, indent=2)
+    Args:
+        raw_input (str): The routing table input as a string.
+
+    Returns:
+        str: The formatted string representation of the parsed routes.
+
+    Raises:
+        ValueError: If the input is not from a Linux ip route command.
+    """
+    routes, has_gateway = (_parse_routes_generated or _parse_routes)(raw_input)
+
+    return generate_output(_validate_output(routes, has_gateway))
+
+
+def parse_many(raw_inputs: list) -> list:
+    """
+    Parses a batch of raw ip route outputs in parallel worker processes.
+
+    Meant for callers that collect routing tables from many hosts - the
+    parsing is CPU-bound, so worker processes split the batch across cores
+    instead of walking the inputs serially under the GIL.
+
+    Args:
+        raw_inputs (list): The raw ip route outputs, one string per host.
+
+    Returns:
+        list: The formatted string representations, in input order.
+
+    Raises:
+        ValueError: If any input is not from a Linux ip route command.
+    """
+    with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        return list(pool.map(_parse_one, raw_inputs, chunksize=8))
 
 
 def parse_and_transform() -> None:
     """
     Main function that orchestrates the parsing and printing of routing table information.
-    """
-    name_of_file: str = "parser_templates/ip_route.template"
 
-    result_from_command_as_a_list_parsed, as_fsm = _parse_input(name_of_file,
-                                                                _take_input_directly_from_iproute_command())
-    extracted_result = _extract_output(result_from_command_as_a_list_parsed, as_fsm)
-    output_with_needed_structure: str = generate_output(_validate_output(extracted_result), classic_style=True)
+    Invalid input is reported on stdout and ends the process; this is the
+    only place where validation failures turn into a process exit.
+    """
+    try:
+        output_with_needed_structure: str = _parse_one(_take_input_directly_from_iproute_command())
+    except ValueError:
+        print("ERROR - Input given is not from linux ip route command")
+        exit(0)
 
-    print(output_with_needed_structure)
+    sys.stdout.write(output_with_needed_structure + "\n")
 
 
 if __name__ == '__main__':